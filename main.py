@@ -17,6 +17,8 @@ from lm_dataformat import Archive
 from postprocessor.utils import log
 from postprocessor.deduplicator import Deduplicator
 from postprocessor.analyzer import Analyzer
+from postprocessor.rejection_log import RejectionLog
+from postprocessor.estimator import Estimator
 
 
 # TODO: Typehints and function description could be useful.
@@ -79,6 +81,14 @@ if __name__ == '__main__':
                         help="Create folder with CSV files where all duplicated documents are listed")
     parser.add_argument("--min_txt_len", type=int, default=200,
                         help="Minimum Text Length (default 200)")
+    parser.add_argument("--chunksize", type=int, default=1,
+                        help="Number of documents sent to worker process at once (default 1)")
+    parser.add_argument("--estimate", type=int, nargs='?', const=300,
+                        help="Estimate run time and memory on a sample of documents (default 300) without processing dataset")
+    parser.add_argument("--reject_log", type=str, default="index", choices=RejectionLog.DETAIL_LEVELS,
+                        help="Detail level of rejected documents log: none (counts only), index, full (default index)")
+    parser.add_argument("--reject_log_format", type=str, default="jsonl", choices=RejectionLog.FORMATS,
+                        help="Format of rejected documents log: jsonl, csv (default jsonl)")
 
     args = parser.parse_args()
     all_datasets = not args.name
@@ -87,8 +97,17 @@ if __name__ == '__main__':
     if not args.processes:
         args.processes = 1 if (os.cpu_count() - 1) < 2 else os.cpu_count() - 1
 
+    if args.estimate is not None and args.estimate < 1:
+        parser.error("--estimate sample size must be at least 1")
+
+    if args.chunksize < 1:
+        parser.error("--chunksize must be at least 1")
+
+    if args.estimate is not None and not args.metrics:
+        args.metrics = ['stats', 'quality', 'lang', 'dedup']
+
     if args.metrics:
-        if not os.path.exists(output_dir):
+        if args.estimate is None and not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
         get_metrics = 'stats' in args.metrics
@@ -97,7 +116,9 @@ if __name__ == '__main__':
         get_duplicates = 'dedup' in args.metrics
         process_doc_partial = partial(process_doc, metrics=get_metrics, 
                                       quality=get_quality, lang=get_lang)
-        maxtasksperchild = 2500 if get_metrics else 100000
+        # Pool counts one chunk as one task - keep the same number of documents per worker
+        docs_per_worker = 2500 if get_metrics else 100000
+        maxtasksperchild = max(docs_per_worker // args.chunksize, 1)
 
     if args.sample and not os.path.exists(sample_dir):
         os.makedirs(sample_dir)
@@ -118,6 +139,8 @@ if __name__ == '__main__':
     rich_print("Update dataset -> update date in manifest: [green]" + str(args.update) + "[/green]")
     rich_print("Postprocesor will create: [green]" + str(args.processes) + " processes" + "[/green]")
     rich_print("Minimum text length: [green]" + str(MIN_TXT_LENGTH) + "[/green]")
+    if args.estimate is not None:
+        rich_print("Estimate only (sample size): [green]" + str(args.estimate) + "[/green]")
 
     if args.name:
         rich_print("Dataset name: [green]" + str(args.name) + "[/green]")
@@ -141,6 +164,19 @@ if __name__ == '__main__':
             logging.info("------------------------------------------------")
             logging.info(f"Starting postprocesor on dataset: {dataset.name}")
 
+            if args.estimate is not None:
+                log("Estimating dataset: [red]" + dataset.name + "[/red]", "INFO")
+                estimate = Estimator.estimate(dataset, process_doc_partial, initialize_worker, args.processes,
+                                              sample_size = args.estimate, docs_per_worker = docs_per_worker,
+                                              dedup = get_duplicates)
+                for key, value in estimate.items():
+                    rich_print(f"  {key}: [green]{value}[/green]")
+                logging.info(f"Estimate for dataset {dataset.name}: {estimate}")
+                if estimate:
+                    log(f"Recommended: --processes {estimate['recommended_processes']} "
+                        f"--chunksize {estimate['recommended_chunksize']}", "INFO")
+                continue
+
             log("Processing dataset: [red]" + dataset.name + "[/red]", "INFO")
 
             stats = {'documents': 0}
@@ -176,20 +212,21 @@ if __name__ == '__main__':
                 # TODO: Check EXT_DATA generator
                 ds_extdata = dataset.ext_data
 
-                with Pool(initializer = initialize_worker, processes = args.processes,
+                # Rejected documents log is written in batches by background listener (closed on exit)
+                with RejectionLog(os.path.join(logs_dir, dataset.name + '_' + time_now.strftime('%Y-%m-%d--%H-%M-%S') + '_rejected'),
+                                  detail = args.reject_log, fmt = args.reject_log_format) as rejection_log, \
+                     Pool(initializer = initialize_worker, processes = args.processes,
                           maxtasksperchild = maxtasksperchild) as pool:
 
                     for txt, meta, index in tqdm(pool.imap(func = process_doc_partial,
                                                       iterable = enumerate(ds_extdata),
-                                                      chunksize = 1),
+                                                      chunksize = args.chunksize),
                                                 total = dataset_index_max,
                                                 smoothing=0.01):
 
-                        name = meta.get("name", meta.get("url", ""))
-
                         # Check if document is a duplicate
                         if get_duplicates and index in duplicate_indices:
-                            logging.warning(f"Removed duplicate : {name}")
+                            rejection_log.reject(RejectionLog.DUPLICATE, index, meta)
                             continue
 
                         # Check if document has minimum length and words
@@ -197,7 +234,7 @@ if __name__ == '__main__':
 
                             # Check for document language
                             if get_lang and meta['language']['lang'].lower() != 'pl':
-                                logging.warning(f"Removed non 'pl' document : {name} | meta: {meta['language']}")
+                                rejection_log.reject(RejectionLog.NON_PL, index, meta)
                                 continue
 
                             # Add document to final dataset
@@ -217,7 +254,7 @@ if __name__ == '__main__':
 
                             counter += 1
                         else:
-                            logging.warning(f"Removed empty document : {name}")
+                            rejection_log.reject(RejectionLog.EMPTY, index, meta)
 
                 pool.close()
                 pool.join()
@@ -227,6 +264,12 @@ if __name__ == '__main__':
                     log("Found and removed " + str(len(duplicate_indices))+" duplicates", "WARNING")
                     logging.warning(f"Found and removed {len(duplicate_indices)} duplicates")
 
+                rejected = rejection_log.summary()
+                log(f"Rejected documents: {rejected}", "INFO")
+                logging.info(f"Rejected documents: {rejected}")
+                if rejection_log.filename:
+                    log(f"Rejected documents log: {rejection_log.filename}", "INFO")
+
                 log(f"Logs can be found in the 'logs' folder", "INFO")
 
                 log(f"Dataset before: {dataset_index_max} docs -> now: {stats['documents']} docs", "INFO")
@@ -267,6 +310,7 @@ if __name__ == '__main__':
 
                 manifest['stats'] = stats
                 manifest['file_size'] = file_size
+                manifest['rejected'] = rejected
 
                 with open(file_name_manifest, 'w', encoding='utf-8') as mf:
                     json.dump(manifest, mf, indent=4)
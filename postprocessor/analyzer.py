@@ -5,7 +5,6 @@ import numpy
 import textstat
 import fasttext
 from ftlangdetect import detect
-from postprocessor.utils import log
 from postprocessor.quality import sanity_check, get_doc_quality
 
 fasttext.FastText.eprint = lambda x: None   # Suppress warnings from 'fasttext' library
@@ -193,11 +192,12 @@ class Analyzer(object):
             new_meta = self._count_metrics()
 
         if self.quality_metrics:
-            if sanity_check(new_meta):
-                get_doc_quality(new_meta)
-            else:
+            # Metrics are present in every document or in none - fail on the first one instead of continuing
+            if not sanity_check(new_meta):
                 name = self.meta.get("name", self.meta.get("url", ""))
-                log("Required metrics for quality check not found in meta: " + name, "WARNING")
+                raise ValueError("Required metrics for quality check not found in meta: " + name
+                                 + " - run quality together with 'stats' metrics")
+            get_doc_quality(new_meta)
 
         if self.lang_detect:
             new_meta["language"] = detect(self.txt.replace('\n',' '))
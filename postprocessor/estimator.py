@@ -0,0 +1,273 @@
+"""
+Estimator Module
+
+This module provides the Estimator class, an entity responsible for
+predicting run time and memory of the post-processing before it is started.
+A sample of documents spread across the dataset is timed through the real
+`process_doc` path in worker processes, and the results are extrapolated
+using document and character counts from the manifest.
+
+Classes:
+- Estimator: Got functions for sampling, timing and extrapolating the processing of dataset.
+
+Dependencies:
+- os, sys, time, math, statistics: Provide system information, timers, rounding and median.
+- resource: Provides peak RSS of processes (Unix only, optional).
+- tracemalloc, pandas: Provide measurement of deduplication frame memory.
+- multiprocessing: Provides worker pool used for timing the sample.
+- postprocessor.utils: Provides 'log' function (based on 'rich' library) for formatted logs.
+"""
+import os
+import sys
+import math
+import time
+import statistics
+import tracemalloc
+from functools import partial
+from multiprocessing import Pool
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import pandas as pd
+from postprocessor.utils import log
+from postprocessor.deduplicator import Deduplicator
+
+
+_init_time = 0.0
+_tasks_done = 0
+
+
+def _peak_rss_mb() -> float | None:
+    """
+    Returns peak RSS of the current process in MB (None if not available).
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _timed_initializer(initializer) -> None:
+    global _init_time
+    start = time.perf_counter()
+    initializer()
+    _init_time = time.perf_counter() - start
+
+
+def _timed_process(doc, func):
+    global _tasks_done
+    start = time.perf_counter()
+    txt, _, _ = func(doc)
+    elapsed = time.perf_counter() - start
+    _tasks_done += 1
+    return elapsed, len(txt or ""), _init_time, os.getpid(), _tasks_done, _peak_rss_mb()
+
+
+class Estimator:
+    """
+    Represents the Estimator class, an entity responsible for
+    predicting run time, CPU-hours and memory of dataset processing.
+    """
+
+    TARGET_CHUNK_TIME = 0.5         # Seconds of work per chunk sent to worker
+    MEMORY_RESERVE = 0.8            # Part of available memory that can be used by workers
+    GROWTH_WARMUP_DOCS = 5          # First documents of worker skipped when fitting RSS growth
+    GROWTH_MIN_DOCS = 20            # Documents per worker required to fit RSS growth
+    GROWTH_MAX_FACTOR = 2.0         # Cap of projected worker RSS (times measured peak)
+
+    @staticmethod
+    def get_sample(dataset_obj, sample_size: int, total_docs: int) -> tuple[list, float]:
+        """
+        Collects documents spread evenly across the dataset.
+
+        :param dataset_obj: SpeakleashDataset object (dataset).
+        :param sample_size (int): Number of documents to collect.
+        :param total_docs (int): Total number of documents in dataset.
+
+        :return: A tuple containing a list of (index, (txt, meta)) documents
+                and average time (s) of reading one document from dataset.
+        """
+        step = max(total_docs // sample_size, 1)
+        sample = []
+        read = 0
+
+        start = time.perf_counter()
+        for index, doc in enumerate(dataset_obj.ext_data):
+            read += 1
+            if index % step == 0:
+                sample.append((index, doc))
+                if len(sample) >= sample_size:
+                    break
+        read_time = (time.perf_counter() - start) / max(read, 1)
+
+        return sample, read_time
+
+    @staticmethod
+    def get_dedup_memory_mb(sample: list, total_docs: int) -> float:
+        """
+        Measures peak memory of building the deduplication frame (as in Deduplicator.get_duplicates)
+        for sampled documents and scales it to the whole dataset.
+
+        :param sample (list): List of (index, (txt, meta)) documents.
+        :param total_docs (int): Total number of documents in dataset.
+
+        :return: Estimated peak memory (MB) of deduplication for the whole dataset.
+        """
+        tracemalloc.start()
+        records = [
+            {
+                "text": Deduplicator.try_or(txt=txt),
+                "characters": len(txt),
+                "url": meta.get("url", meta.get("name", "-")),
+            }
+            for _, (txt, meta) in sample
+        ]
+        frame = pd.DataFrame(records)
+        frame["is_duplicated"] = frame.duplicated(subset=["text"])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return peak / len(sample) * total_docs / (1024 * 1024)
+
+    @staticmethod
+    def get_available_memory_mb() -> float | None:
+        """
+        Returns available physical memory in MB (None if not available).
+        On Linux 'MemAvailable' from /proc/meminfo is used (includes reclaimable page cache).
+        """
+        try:
+            with open("/proc/meminfo", encoding="utf-8") as meminfo:
+                for line in meminfo:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) / 1024
+        except (OSError, ValueError, IndexError):
+            pass
+
+        try:
+            return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES") / (1024 * 1024)
+        except (ValueError, OSError, AttributeError):
+            return None
+
+    @staticmethod
+    def estimate(dataset_obj, process_func, initializer, processes: int, sample_size: int = 300,
+                 docs_per_worker: int = 100000, dedup: bool = False) -> dict:
+        """
+        Times a sample of documents through 'process_func' and extrapolates
+        wall time, CPU-hours and memory for the whole dataset.
+
+        :param dataset_obj: SpeakleashDataset object (dataset).
+        :param process_func: Function processing one (index, (txt, meta)) document - the same as in main run.
+        :param initializer: Worker initializer (e.g. loading spaCy model).
+        :param processes (int): Number of processes planned for the run.
+        :param sample_size (int): Number of documents used for timing.
+        :param docs_per_worker (int): Documents after which worker is restarted and model is loaded again
+                                      (maxtasksperchild * chunksize).
+        :param dedup (bool): If deduplication pass will be done before processing.
+
+        :return: Dictionary with estimated values.
+        """
+        manifest_stats = dataset_obj.manifest.get("stats", {})
+        total_docs = manifest_stats.get("documents")
+        total_chars = manifest_stats.get("characters")
+
+        if not total_docs:
+            log("No document count in manifest - counting documents...", "WARNING")
+            total_docs = sum(1 for _ in dataset_obj.ext_data)
+
+        if not total_docs:
+            log(f"Dataset [{dataset_obj.name}] is empty - nothing to estimate", "WARNING")
+            return {}
+
+        log(f"Sampling {sample_size} documents from [{dataset_obj.name}] dataset...", "INFO")
+        sample, read_time = Estimator.get_sample(dataset_obj, sample_size, total_docs)
+
+        log(f"Timing {len(sample)} documents in {processes} processes...", "INFO")
+        with Pool(initializer=partial(_timed_initializer, initializer), processes=processes) as pool:
+            results = pool.map(partial(_timed_process, func=process_func), sample, chunksize=1)
+
+        doc_times = [r[0] for r in results]
+        sample_chars = sum(r[1] for r in results)
+        init_times = {r[3]: r[2] for r in results}
+        worker_rss = {}
+        for r in results:
+            if r[5] is not None:
+                worker_rss.setdefault(r[3], []).append((r[4], r[5]))
+
+        # Extrapolate by characters if possible (processing time depends mostly on text length)
+        sample_time = sum(doc_times)
+        if total_chars and sample_chars:
+            cpu_seconds = sample_time / sample_chars * total_chars
+        else:
+            cpu_seconds = sample_time / len(doc_times) * total_docs
+
+        model_load = sum(init_times.values()) / len(init_times)
+        worker_starts = max(processes, math.ceil(total_docs / docs_per_worker))
+        cpu_seconds += worker_starts * model_load
+
+        # Parent reads dataset once in main loop (and once more for deduplication)
+        read_seconds = read_time * total_docs
+        wall_seconds = max(cpu_seconds / processes, read_seconds)
+        if dedup:
+            wall_seconds += read_seconds
+
+        # Memory of workers (and recommendation) is based on measured peak RSS.
+        # Upper bound is reported separately: median RSS growth per document after warm-up
+        # (robust to single large documents) projected to docs_per_worker, capped.
+        worker_peak_mb = None
+        worker_upper_mb = None
+        for rss in worker_rss.values():
+            rss.sort()
+            peak = rss[-1][1]
+            worker_peak_mb = max(worker_peak_mb or 0, peak)
+
+            steady = rss[Estimator.GROWTH_WARMUP_DOCS:]
+            if len(steady) < Estimator.GROWTH_MIN_DOCS - Estimator.GROWTH_WARMUP_DOCS:
+                continue
+            growth = statistics.median(
+                (rss_b - rss_a) / (task_b - task_a)
+                for (task_a, rss_a), (task_b, rss_b) in zip(steady, steady[1:])
+            )
+            projected = peak + growth * max(docs_per_worker - rss[-1][0], 0)
+            worker_upper_mb = max(worker_upper_mb or 0, min(projected, peak * Estimator.GROWTH_MAX_FACTOR))
+        if worker_upper_mb is not None:
+            worker_upper_mb = max(worker_upper_mb, worker_peak_mb)
+
+        parent_mb = _peak_rss_mb()
+        if dedup and parent_mb is not None:
+            parent_mb += Estimator.get_dedup_memory_mb(sample, total_docs)
+        total_mb = None
+        if worker_peak_mb is not None and parent_mb is not None:
+            total_mb = worker_peak_mb * processes + parent_mb
+
+        recommended_processes = max((os.cpu_count() or 2) - 1, 1)
+        available_mb = Estimator.get_available_memory_mb()
+        if worker_peak_mb and available_mb and parent_mb is not None:
+            by_memory = int((available_mb * Estimator.MEMORY_RESERVE - parent_mb) // worker_peak_mb)
+            recommended_processes = max(min(recommended_processes, by_memory), 1)
+
+        mean_doc_time = sample_time / len(doc_times)
+        recommended_chunksize = max(int(Estimator.TARGET_CHUNK_TIME / mean_doc_time), 1) if mean_doc_time > 0 else 1
+        recommended_chunksize = min(recommended_chunksize, max(total_docs // (recommended_processes * 4), 1))
+
+        return {
+            "documents": total_docs,
+            "characters": total_chars,
+            "sample_documents": len(doc_times),
+            "mean_doc_time": round(mean_doc_time, 4),
+            "model_load_time": round(model_load, 2),
+            "processes": processes,
+            "wall_hours": round(wall_seconds / 3600, 2),
+            "cpu_hours": round(cpu_seconds / 3600, 2),
+            "worker_docs_measured": max(r[4] for r in results),
+            "worker_peak_mb": round(worker_peak_mb) if worker_peak_mb is not None else None,
+            "worker_peak_upper_bound_mb": round(worker_upper_mb) if worker_upper_mb is not None else None,
+            "parent_peak_mb": round(parent_mb) if parent_mb is not None else None,
+            "total_memory_mb": round(total_mb) if total_mb is not None else None,
+            "available_memory_mb": round(available_mb) if available_mb is not None else None,
+            "recommended_processes": recommended_processes,
+            "recommended_chunksize": recommended_chunksize,
+        }
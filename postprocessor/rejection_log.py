@@ -0,0 +1,142 @@
+"""
+Rejection Log Module
+
+This module provides the RejectionLog class, an entity responsible for
+recording documents removed from the dataset (duplicates, non 'pl' and empty documents).
+The main loop only increments a counter and appends a row tuple to a list -
+every `batch_size` rows the whole batch is put on a queue and a background
+`QueueListener` writes it to file as compact JSONL or CSV.
+
+Classes:
+- RejectionLog: Collects per-reason counts and writes per-document rejection events.
+
+Dependencies:
+- csv, json: Provide serialization of rejection events.
+- logging.handlers, queue: Provide background queue listener.
+"""
+import csv
+import json
+import queue
+import logging.handlers
+
+
+class _BatchWriter(logging.handlers.QueueListener):
+    """
+    Queue listener writing batches of rejection rows to file (runs in background thread).
+    """
+
+    def __init__(self, batch_queue: queue.SimpleQueue, stream, fmt: str = "jsonl", fields: tuple = ()):
+        super().__init__(batch_queue)
+        self.stream = stream
+        self.fmt = fmt
+        self.fields = fields
+        if fmt == "csv":
+            self.writer = csv.writer(stream)
+            self.writer.writerow(fields)
+
+    def handle(self, batch: list) -> None:
+        if self.fmt == "csv":
+            self.writer.writerows(batch)
+        else:
+            self.stream.write("".join(
+                json.dumps(dict(zip(self.fields, row)), ensure_ascii=False, separators=(",", ":")) + "\n"
+                for row in batch
+            ))
+        self.stream.flush()
+
+
+class RejectionLog:
+    """
+    Represents the RejectionLog class, an entity responsible for
+    counting and logging documents removed from the dataset.
+    Can be used as a context manager - remaining rows are written on exit.
+    """
+
+    DUPLICATE = "duplicate"
+    NON_PL = "non_pl"
+    EMPTY = "empty"
+    REASONS = (DUPLICATE, NON_PL, EMPTY)
+
+    DETAIL_LEVELS = ("none", "index", "full")
+    FORMATS = ("jsonl", "csv")
+    FIELDS = {
+        "index": ("reason", "index"),
+        "full": ("reason", "index", "name", "lang"),
+    }
+
+    def __init__(self, filename: str, detail: str = "index", fmt: str = "jsonl", batch_size: int = 10000):
+        """
+        :param filename (str): Path of the rejection log file (without extension).
+        :param detail (str): Per-document detail level: 'none' (summary counts only),
+                            'index' (reason and index) or 'full' (reason, index, name, language).
+        :param fmt (str): Output format: 'jsonl' or 'csv'.
+        :param batch_size (int): Number of rows handed over to background writer at once.
+        """
+        self.detail = detail
+        self.batch_size = batch_size
+        self.counts = dict.fromkeys(self.REASONS, 0)
+        self.filename = None
+        self._rows = None
+        self._queue = None
+        self._listener = None
+
+        if detail == "none":
+            return
+
+        self.filename = f"{filename}.{fmt}"
+        self._rows = []
+        self._queue = queue.SimpleQueue()
+        stream = open(self.filename, "w", encoding="utf-8", newline="")
+        self._listener = _BatchWriter(self._queue, stream, fmt, self.FIELDS[detail])
+        self._listener.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def reject(self, reason: str, index: int, meta: dict = None) -> None:
+        """
+        Counts the rejected document and buffers its row for the background writer.
+
+        :param reason (str): Reason code (RejectionLog.DUPLICATE / NON_PL / EMPTY).
+        :param index (int): Index of the document in dataset.
+        :param meta (dict): Document meta - used only for 'full' detail level.
+        """
+        self.counts[reason] += 1
+
+        if self._rows is None:
+            return
+
+        if self.detail == "full":
+            meta = meta or {}
+            lang = meta.get("language")
+            self._rows.append((reason, index, meta.get("name", meta.get("url", "")),
+                               lang.get("lang") if isinstance(lang, dict) else None))
+        else:
+            self._rows.append((reason, index))
+
+        if len(self._rows) >= self.batch_size:
+            self._queue.put(self._rows)
+            self._rows = []
+
+    def summary(self) -> dict:
+        """
+        Returns the number of rejected documents per reason (for manifest).
+        """
+        return dict(self.counts)
+
+    def close(self) -> None:
+        """
+        Hands over remaining rows, stops the background writer and closes the file.
+        """
+        if self._listener is None:
+            return
+
+        if self._rows:
+            self._queue.put(self._rows)
+        self._listener.stop()
+        self._listener.stream.close()
+        self._rows = None
+        self._listener = None